@@ -8,6 +8,7 @@ import pyjc
 import struct
 import zipfile
 import logging
+import tempfile
 
 
 Logger = None
@@ -19,6 +20,10 @@ def init_logging(logname, logfile, debug):
     global Logger
 
     Logger = logging.getLogger(logname)
+    for handler in list(Logger.handlers):
+        Logger.removeHandler(handler)
+        handler.close()
+
     ch = logging.StreamHandler()
     formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
             
@@ -68,6 +73,64 @@ def log_error(message):
         Logger.error(message)
 
 
+MANIFEST_PATH = 'META-INF/MANIFEST.MF'
+VERSIONS_PREFIX = 'META-INF/versions/'
+MODULE_INFO = 'module-info.class'
+
+
+def get_attribute(attributes, name, default=None):
+    """get manifest attribute value, ignoring case of the attribute name"""
+
+    for key in attributes:
+        if key.lower() == name.lower():
+            return attributes[key]
+
+    return default
+
+
+def parse_manifest(data):
+    """parse manifest data into main and per-entry sections"""
+
+    manifest = dict()
+    manifest['main'] = dict()
+    manifest['entries'] = dict()
+
+    sections = list()
+    section = list()
+    for line in data.splitlines():
+        if line == '':
+            if section:
+                sections.append(section)
+                section = list()
+        elif line.startswith(' ') and section:
+            section[-1] += line[1:]
+        else:
+            section.append(line)
+    if section:
+        sections.append(section)
+
+    for i in range(0, len(sections)):
+        attributes = dict()
+        for line in sections[i]:
+            if ':' not in line:
+                log_warn('Invalid Manifest Line: ' + line)
+                continue
+            name, value = line.split(':', 1)
+            if value.startswith(' '):
+                value = value[1:]
+            attributes[name.strip()] = value.rstrip()
+
+        entry_name = get_attribute(attributes, 'Name')
+        if i == 0 and entry_name is None:
+            manifest['main'] = attributes
+        elif entry_name is not None:
+            manifest['entries'][entry_name] = attributes
+        else:
+            log_warn('Manifest Section Without Name')
+
+    return manifest
+
+
 class JarFile:
 
     def __init__(self, filename, debug=False, logfile=None):
@@ -96,11 +159,9 @@ class JarFile:
                 fileitem['class'] = pyjc.JavaClass(tmpfile, debug=debug, logfile=logfile)
                 os.remove(tmpfile)
                 self.class_files.append(fileitem)
-            elif fileitem['name'] == 'MANIFEST.MF':
-                manifest = fileitem['data'].split('\r\n')
-                for item in manifest:
-                    if item.startswith('Main-Class') == True:
-                        self.entry_point = item.strip().split(':')[-1].strip()
+            elif fileitem['path'].upper() == MANIFEST_PATH:
+                manifest = parse_manifest(fileitem['data'])
+                self.entry_point = get_attribute(manifest['main'], 'Main-Class')
             else:
                 self.non_class_files.append(fileitem)
         
@@ -118,4 +179,135 @@ class JarFile:
                 fileitem['data'] = zf.read(name)
                 filelist.append(fileitem)
 
-        return filelist
\ No newline at end of file
+        return filelist
+
+
+class JarProbe:
+
+    def __init__(self, filename, release=None, debug=False, logfile=None):
+        """init JarProbe class"""
+
+        logname = os.path.basename(filename)
+        init_logging(logname, logfile, debug)
+
+        log_debug('File: ' + filename)
+
+        if os.path.isfile(filename) == False:
+            raise Exception('File Not Exist: ' + filename)
+
+        self.filename = filename
+        self.manifest = None
+        self.main_class = None
+        self.implementation_version = None
+        self.automatic_module_name = None
+        self.multi_release = False
+        self.versions = dict()
+        self.module_info = None
+        self.module_info_path = None
+
+        self.__debug = debug
+        self.__logfile = logfile
+
+        with zipfile.ZipFile(self.filename) as zf:
+            root_module = False
+            module_paths = dict()
+            for name in zf.namelist():
+                if name.upper() == MANIFEST_PATH:
+                    log_debug('Decompress File: ' + name)
+                    self.manifest = parse_manifest(zf.read(name))
+                elif name == MODULE_INFO:
+                    root_module = True
+                elif name.startswith(VERSIONS_PREFIX):
+                    if name.endswith('/'):
+                        continue
+                    version = name[len(VERSIONS_PREFIX):].split('/', 1)
+                    if len(version) != 2 or version[0].isdigit() == False:
+                        continue
+                    if str(int(version[0])) != version[0] or int(version[0]) < 9:
+                        continue
+                    self.versions.setdefault(int(version[0]), list()).append(version[1])
+                    if version[1] == MODULE_INFO:
+                        module_paths[int(version[0])] = name
+
+            if self.manifest is not None:
+                main = self.manifest['main']
+                self.main_class = get_attribute(main, 'Main-Class')
+                self.implementation_version = get_attribute(main, 'Implementation-Version')
+                self.automatic_module_name = get_attribute(main, 'Automatic-Module-Name')
+                self.multi_release = get_attribute(main, 'Multi-Release', '').lower() == 'true'
+
+            if self.multi_release:
+                for version in sorted(module_paths, reverse=True):
+                    if release is not None and version > release:
+                        continue
+                    self.module_info_path = module_paths[version]
+                    break
+
+            if self.module_info_path is None and root_module:
+                self.module_info_path = MODULE_INFO
+
+            if self.module_info_path is not None:
+                log_debug('Decompress File: ' + self.module_info_path)
+                self.module_info = self.__parse_module_info(zf.read(self.module_info_path))
+
+        log_debug('JarProbe::MainClass: ' + str(self.main_class))
+        log_debug('JarProbe::ImplementationVersion: ' + str(self.implementation_version))
+        log_debug('JarProbe::AutomaticModuleName: ' + str(self.automatic_module_name))
+        log_debug('JarProbe::MultiRelease: ' + str(self.multi_release))
+        log_debug('JarProbe::Versions: ' + str(sorted(self.versions)))
+        log_debug('JarProbe::ModuleInfoPath: ' + str(self.module_info_path))
+
+
+    def __parse_module_info(self, data):
+        """parse requires and exports from module-info.class data"""
+
+        tmpdir = tempfile.mkdtemp()
+        tmpfile = os.path.join(tmpdir, '_' + MODULE_INFO)
+        try:
+            with open(tmpfile, 'wb') as f:
+                f.write(data)
+            java_class = pyjc.JavaClass(tmpfile, debug=self.__debug, logfile=self.__logfile)
+        finally:
+            if os.path.isfile(tmpfile):
+                os.remove(tmpfile)
+            os.rmdir(tmpdir)
+
+        module = java_class.module_attribute
+        if module is None:
+            log_warn('Module Attribute Not Found')
+            return None
+
+        constant_pool = java_class.constant_pool
+
+        def constant_name(index):
+            if index == 0:
+                return None
+            name_index = constant_pool[index-1]['info']['name_index']
+            return constant_pool[name_index-1]['info']['data']
+
+        def utf8(index):
+            if index == 0:
+                return None
+            return constant_pool[index-1]['info']['data']
+
+        module_info = dict()
+        module_info['name'] = constant_name(module.module_name_index)
+        module_info['version'] = utf8(module.module_version_index)
+        module_info['requires'] = list()
+        module_info['exports'] = list()
+
+        for item in module.requires:
+            requires = dict()
+            requires['name'] = constant_name(item['requires_index'])
+            requires['flags'] = item['requires_flags']
+            requires['version'] = utf8(item['requires_version_index'])
+            module_info['requires'].append(requires)
+
+        for item in module.exports:
+            exports = dict()
+            exports['package'] = constant_name(item['exports_index']).replace('/', '.')
+            exports['flags'] = item['exports_flags']
+            exports['to'] = [constant_name(index) for index in item['exports_to_index']]
+            module_info['exports'].append(exports)
+
+        return module_info
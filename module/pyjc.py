@@ -19,6 +19,10 @@ def init_logging(logname, logfile, debug):
     global Logger
 
     Logger = logging.getLogger(logname)
+    for handler in list(Logger.handlers):
+        Logger.removeHandler(handler)
+        handler.close()
+
     ch = logging.StreamHandler()
     formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
             
@@ -235,6 +239,88 @@ class CodeAttribute:
         self.length = pointer
 
 
+class ModuleAttribute:
+
+    def __init__(self, data):
+        """init ModuleAttribute class"""
+
+        self.module_name_index = None
+        self.module_flags = None
+        self.module_version_index = None
+        self.requires_count = None
+        self.requires = list()
+        self.exports_count = None
+        self.exports = list()
+
+        pointer = 0
+
+        self.module_name_index = struct.unpack('>H', data[0x00:0x02])[0]
+        log_debug('ModuleAttribute::ModuleNameIndex: ' + hex(self.module_name_index))
+
+        self.module_flags = struct.unpack('>H', data[0x02:0x04])[0]
+        log_debug('ModuleAttribute::ModuleFlags: ' + hex(self.module_flags))
+
+        self.module_version_index = struct.unpack('>H', data[0x04:0x06])[0]
+        log_debug('ModuleAttribute::ModuleVersionIndex: ' + hex(self.module_version_index))
+
+        self.requires_count = struct.unpack('>H', data[0x06:0x08])[0]
+        log_debug('ModuleAttribute::RequiresCount: ' + hex(self.requires_count))
+        pointer = 0x08
+
+        for i in range(0, self.requires_count):
+            log_debug('######## Requires ' + hex(i+1) + ' ########')
+
+            requires = dict()
+            requires_index = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+            log_debug('Requires::RequiresIndex: ' + hex(requires_index))
+            pointer += 2
+
+            requires_flags = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+            log_debug('Requires::RequiresFlags: ' + hex(requires_flags))
+            pointer += 2
+
+            requires_version_index = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+            log_debug('Requires::RequiresVersionIndex: ' + hex(requires_version_index))
+            pointer += 2
+
+            requires['requires_index'] = requires_index
+            requires['requires_flags'] = requires_flags
+            requires['requires_version_index'] = requires_version_index
+
+            self.requires.append(requires)
+
+        self.exports_count = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+        log_debug('ModuleAttribute::ExportsCount: ' + hex(self.exports_count))
+        pointer += 2
+
+        for i in range(0, self.exports_count):
+            log_debug('######## Exports ' + hex(i+1) + ' ########')
+
+            exports = dict()
+            exports_index = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+            log_debug('Exports::ExportsIndex: ' + hex(exports_index))
+            pointer += 2
+
+            exports_flags = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+            log_debug('Exports::ExportsFlags: ' + hex(exports_flags))
+            pointer += 2
+
+            exports_to_count = struct.unpack('>H', data[pointer:pointer+0x02])[0]
+            log_debug('Exports::ExportsToCount: ' + hex(exports_to_count))
+            pointer += 2
+
+            exports_to_index = list()
+            for j in range(0, exports_to_count):
+                exports_to_index.append(struct.unpack('>H', data[pointer:pointer+0x02])[0])
+                pointer += 2
+
+            exports['exports_index'] = exports_index
+            exports['exports_flags'] = exports_flags
+            exports['exports_to_index'] = exports_to_index
+
+            self.exports.append(exports)
+
+
 class JavaClass:
 
     def __init__(self, filename, debug=False, logfile=None):
@@ -268,6 +354,7 @@ class JavaClass:
         self.attributes_count = None
         self.attributes = list()
         self.code_attributes = list()
+        self.module_attribute = None
         
         pointer = 0
 
@@ -406,6 +493,16 @@ class JavaClass:
                 info['name_type_index'] = name_type_index
                 log_debug('InvokeDynamicInfo::NameTypeIndex: ' + hex(name_type_index))
                 pointer += 2
+            elif tag == 19:
+                name_index = struct.unpack('>H', self.data[pointer:pointer+0x02])[0]
+                info['name_index'] = name_index
+                log_debug('ModuleInfo::NameIndex: ' + hex(name_index))
+                pointer += 2
+            elif tag == 20:
+                name_index = struct.unpack('>H', self.data[pointer:pointer+0x02])[0]
+                info['name_index'] = name_index
+                log_debug('PackageInfo::NameIndex: ' + hex(name_index))
+                pointer += 2
             else:
                 log_error('Invalid Constanst Type')
                 raise Exception('Invalid Constanst Type')
@@ -482,4 +579,12 @@ class JavaClass:
                     code_attribute = CodeAttribute(attribute_info.info)
                     self.code_attributes.append(code_attribute)
                     index += 1
+
+        for i in range(0, self.attributes_count):
+            attribute_info = self.attributes[i]
+            constant = self.constant_pool[attribute_info.name_index-1]
+            if constant['tag'] == 1 and \
+               constant['info']['data'] == 'Module':
+                log_debug('######## Module ########')
+                self.module_attribute = ModuleAttribute(attribute_info.info)
         
@@ -13,4 +13,61 @@ if __name__ == '__main__':
 
     logfile = 'debug.txt'
 
-    testjar = pyjar.JarFile('HelloWorld.jar', debug=True, logfile=logfile)
\ No newline at end of file
+    testjar = pyjar.JarFile('HelloWorld.jar', debug=True, logfile=logfile)
+    assert testjar.entry_point == 'HelloWorld'
+
+    # manifest parsing
+    manifest = pyjar.parse_manifest('Main-Class: com.ex.Lo\r ngName \rX-Empty:\r\rName: a/B.class\rSealed: true\r')
+    assert manifest['main'] == {'Main-Class': 'com.ex.LongName', 'X-Empty': ''}
+    assert manifest['entries'] == {'a/B.class': {'Name': 'a/B.class', 'Sealed': 'true'}}
+
+    manifest = pyjar.parse_manifest('Manifest-Version: 1.0\r\nMain-Class: HelloWorld\r\n\r\n')
+    assert manifest['main']['Main-Class'] == 'HelloWorld'
+    assert manifest['entries'] == {}
+
+    manifest = pyjar.parse_manifest('main-class: Foo\nmulti-release: true\n\nname: a/B.class\nsealed: true\n')
+    assert pyjar.get_attribute(manifest['main'], 'Main-Class') == 'Foo'
+    assert pyjar.get_attribute(manifest['main'], 'Multi-Release') == 'true'
+    assert pyjar.get_attribute(manifest['main'], 'Implementation-Version') is None
+    assert manifest['entries'] == {'a/B.class': {'name': 'a/B.class', 'sealed': 'true'}}
+
+    # plain jar
+    probe = pyjar.JarProbe('HelloWorld.jar')
+    assert probe.main_class == 'HelloWorld'
+    assert probe.implementation_version is None
+    assert probe.automatic_module_name is None
+    assert probe.multi_release == False
+    assert probe.versions == {}
+    assert probe.module_info is None
+
+    # multi-release modular jar with folded, LF-only manifest
+    probe = pyjar.JarProbe('ModuleApp.jar')
+    assert probe.manifest['entries'] == {'com/ex/': {'Name': 'com/ex/', 'Sealed': 'true'}}
+    assert probe.main_class == 'com.ex.ApplicationEntryPointWithAVeryLongNameThatIsFolded'
+    assert probe.implementation_version == '1.2'
+    assert probe.automatic_module_name == 'com.ex'
+    assert probe.multi_release == True
+    assert probe.versions == {9: ['module-info.class', 'com/ex/A.class'], 11: ['module-info.class']}
+    assert probe.module_info_path == 'META-INF/versions/11/module-info.class'
+    assert probe.module_info['version'] == '1.3'
+
+    # versions/09 and versions/010 are not canonical and must be ignored
+    probe = pyjar.JarProbe('ModuleApp.jar', release=10)
+    assert probe.module_info_path == 'META-INF/versions/9/module-info.class'
+    assert probe.module_info['name'] == 'com.ex'
+    assert probe.module_info['version'] == '1.2'
+    assert [item['name'] for item in probe.module_info['requires']] == ['java.base', 'java.logging']
+    assert probe.module_info['exports'] == [
+        {'package': 'com.ex', 'flags': 0, 'to': []},
+        {'package': 'com.ex.internal', 'flags': 0, 'to': ['java.base']}]
+
+    probe = pyjar.JarProbe('ModuleApp.jar', release=8)
+    assert probe.module_info_path == 'module-info.class'
+
+    # same layout without Multi-Release ignores META-INF/versions
+    probe = pyjar.JarProbe('ModuleLib.jar')
+    assert probe.multi_release == False
+    assert probe.module_info_path == 'module-info.class'
+    assert probe.module_info['version'] == '1.0'
+    assert probe.module_info['requires'] == [{'name': 'java.base', 'flags': 0, 'version': None}]
+    assert probe.module_info['exports'] == [{'package': 'com.ex', 'flags': 0, 'to': []}]